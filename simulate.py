@@ -1,4 +1,5 @@
 import argparse
+import logging
 import yaml
 from pathlib import Path
 
@@ -16,6 +17,12 @@ def main():
     parser.add_argument("--current", type=float, default=-5.0, help="Discharge/charge current (A)")
     parser.add_argument("--time_steps", type=int, default=10, help="Simulation duration in seconds")
     parser.add_argument("--time_step", type=float, default=1.0, help="Single step length (s)")
+    parser.add_argument(
+        "--scheme",
+        choices=["explicit", "implicit"],
+        default="explicit",
+        help="Time integration; implicit allows much larger --time_step",
+    )
     parser.add_argument(
         "--use_electrochem",
         action="store_true",
@@ -24,6 +31,7 @@ def main():
     parser.add_argument("--plot", nargs="?", const="show", help="Plot temperature history; optionally specify HTML output path")
     parser.add_argument("--cooling", choices=["passive", "liquid", "pcm"], default="passive", help="Choose cooling system type")
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
     cfg = load_config(args.config)
 
@@ -56,6 +64,7 @@ def main():
         time_steps=args.time_steps,
         time_step=args.time_step,
         external_heat=external_heat,
+        scheme=args.scheme,
     )
 
     if args.plot is not None:
@@ -3,10 +3,17 @@ import argparse
 from itertools import product
 
 import dask
+import numpy as np
 from dask.distributed import Client, LocalCluster
 from ruamel import yaml
 
 from thermal_model import ThermalManagementModel
+from thermal_model.core import BATCH_PARAMETERS
+
+CURRENT = -5
+TIME_STEPS = 30
+# Largest batch (cases * zones * steps) simulated in one process before splitting across Dask workers
+MAX_BATCH_VALUES = 20_000_000
 
 
 def load_config(path):
@@ -17,18 +24,25 @@ def load_config(path):
 def run_case(params, base_cfg):
     cfg = {**base_cfg, **params}
     model = ThermalManagementModel(**cfg)
-    history = model.simulate(current=-5, time_steps=30, verbose=False)
+    history = model.simulate(current=CURRENT, time_steps=TIME_STEPS, verbose=False)
     max_temp = history.max()
     return {*params.items(), ("max_temp", max_temp)}
 
 
+def run_batch(cases, base_cfg):
+    model = ThermalManagementModel(**base_cfg)
+    histories = model.simulate_batch(cases, current=CURRENT, time_steps=TIME_STEPS)
+    return [{*params.items(), ("max_temp", history.max())} for params, history in zip(cases, histories)]
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", required=True)
     parser.add_argument("--param", action="append", nargs=3, metavar=("name", "start", "end"), help="Parameter sweep spec")
+    parser.add_argument("--dtype", choices=["float64", "float32"], default="float64", help="Floating point type of the simulation arrays")
     args = parser.parse_args()
 
-    base_cfg = load_config(args.config)
+    base_cfg = {**load_config(args.config), "dtype": args.dtype}
 
     sweep_params = {}
     for name, start, end in args.param:
@@ -40,10 +54,22 @@ def main():
 
     cases = [dict(item for d in combo for item in d.items()) for combo in product(*grid)]
 
-    cluster = LocalCluster()
-    client = Client(cluster)
-    futures = [client.submit(run_case, p, base_cfg) for p in cases]
-    results = client.gather(futures)
+    if not set(sweep_params) <= BATCH_PARAMETERS:
+        # Shape-changing parameters (e.g. num_zones) need one model per case
+        cluster = LocalCluster()
+        client = Client(cluster)
+        futures = [client.submit(run_case, p, base_cfg) for p in cases]
+        results = client.gather(futures)
+    else:
+        values_per_case = base_cfg.get("num_zones", 3) * TIME_STEPS
+        chunk = max(1, MAX_BATCH_VALUES // values_per_case)
+        if len(cases) <= chunk:
+            results = run_batch(cases, base_cfg)
+        else:
+            cluster = LocalCluster()
+            client = Client(cluster)
+            futures = [client.submit(run_batch, cases[i : i + chunk], base_cfg) for i in range(0, len(cases), chunk)]
+            results = [r for part in client.gather(futures) for r in part]
     print(results)
 
 
@@ -0,0 +1,24 @@
+import pytest
+
+from thermal_model import _kernels
+
+
+@pytest.fixture
+def compiled_and_numpy(monkeypatch):
+    """Return ``run(fn) -> (compiled, reference)``.
+
+    ``fn`` is called once with the numba kernels enabled and once on the
+    NumPy path, so tests can check that both give the same result.
+    """
+
+    def run(fn):
+        available = _kernels.NUMBA_AVAILABLE
+        compiled = fn()
+        monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", False)
+        try:
+            reference = fn()
+        finally:
+            monkeypatch.setattr(_kernels, "NUMBA_AVAILABLE", available)
+        return compiled, reference
+
+    return run
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from thermal_model.control import MPCController
+
+
+@pytest.mark.parametrize("dt", [1.0, 5.0])  # k = 0.4 and k = 2 (a < 0, QP only)
+def test_closed_form_matches_qp(dt):
+    rng = np.random.default_rng(0)
+    fast = MPCController(horizon=6, htc=8000, area=0.05, dt=dt)
+    slow = MPCController(horizon=6, htc=8000, area=0.05, dt=dt, slow_mode=True)
+    for _ in range(10):
+        temperatures = rng.uniform(44, 52, size=4)
+        expected = slow.compute_actions(temperatures, ambient=40.0).coolant_temp
+        actual = fast.compute_actions(temperatures, ambient=40.0).coolant_temp
+        assert np.isclose(actual, expected, atol=1e-4)
+
+
+def test_no_cooling_needed_below_limit():
+    controller = MPCController(htc=8000, area=0.05)
+    cooling = controller.compute_actions(np.array([30.0, 32.0]), ambient=25.0)
+    assert cooling.coolant_temp == 25.0
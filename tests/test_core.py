@@ -1,5 +1,8 @@
 import numpy as np
+import pytest
+from scipy import sparse
 from thermal_model import ThermalManagementModel
+from thermal_model.cooling import LiquidCooling, PCMCooling
 
 
 def test_temperature_rises_under_charge():
@@ -50,4 +53,150 @@ def test_contact_resistance_influences_conduction():
     q_low = model_lowR._zone_heat_losses(0)
     q_high = model_highR._zone_heat_losses(0)
     # Higher contact resistance implies lower conduction heat loss magnitude
-    assert abs(q_high) < abs(q_low) 
\ No newline at end of file
+    assert abs(q_high) < abs(q_low) 
+
+
+def test_compiled_path_matches_numpy_path(compiled_and_numpy):
+    def run():
+        model = ThermalManagementModel(
+            capacity=50,
+            internal_resistance=0.1,
+            ambient_temperature=25,
+            num_zones=4,
+            cooling_system=LiquidCooling(),
+        )
+        history = model.simulate(current=20, time_steps=20, verbose=False, external_heat=[5.0, 0.0, 0.0, 2.0])
+        return history, model.power_loss.copy()
+
+    (compiled, compiled_loss), (reference, reference_loss) = compiled_and_numpy(run)
+    assert np.allclose(compiled, reference)
+    assert np.allclose(compiled_loss, reference_loss)
+    assert np.all(reference_loss > [5.0, 0.0, 0.0, 2.0])
+
+
+def test_compiled_pcm_cooling_tracks_latent_energy(compiled_and_numpy):
+    def run():
+        pcm = PCMCooling(phase_temp=26.0)
+        model = ThermalManagementModel(
+            capacity=50,
+            internal_resistance=0.1,
+            ambient_temperature=25,
+            num_zones=3,
+            cooling_system=pcm,
+        )
+        return model.simulate(current=30, time_steps=15, verbose=False), pcm._used_energy
+
+    (compiled, used_compiled), (reference, used_reference) = compiled_and_numpy(run)
+    assert np.allclose(compiled, reference)
+    assert np.isclose(used_compiled, used_reference)
+
+
+@pytest.mark.parametrize("scheme, time_step", [("explicit", 1.0), ("implicit", 5.0)])
+def test_simulate_batch_matches_individual_runs(scheme, time_step):
+    base = dict(capacity=50, internal_resistance=0.1, ambient_temperature=25, num_zones=3)
+    cases = [
+        {"internal_resistance": 0.05},
+        {"internal_resistance": 0.2, "contact_resistance": 0.01},
+        {"ambient_temperature": 30, "convective_heat_transfer_coefficient": 5},
+    ]
+    run = dict(current=20, time_steps=10, time_step=time_step, scheme=scheme)
+    batch = ThermalManagementModel(**base).simulate_batch(cases, **run)
+    assert batch.shape == (3, 10, 3)
+    for params, history in zip(cases, batch):
+        single = ThermalManagementModel(**{**base, **params}).simulate(verbose=False, **run)
+        assert np.allclose(history, single, rtol=0, atol=1e-9)
+
+
+def test_implicit_scheme_stable_for_large_steps(compiled_and_numpy):
+    def run(scheme, time_steps, time_step):
+        model = ThermalManagementModel(
+            capacity=50,
+            internal_resistance=0.1,
+            ambient_temperature=25,
+            num_zones=5,
+        )
+        model.temperature = np.array([40.0, 25.0, 25.0, 25.0, 40.0])
+        return model.simulate(current=10, time_steps=time_steps, time_step=time_step, verbose=False, scheme=scheme)
+
+    # Explicit Euler oscillates at this step size; backward Euler stays smooth and bounded
+    implicit = run("implicit", 10, 5.0)
+    assert np.all((implicit >= 25) & (implicit <= 40))
+    assert np.ptp(implicit[-1]) < np.ptp(implicit[0])
+    assert np.allclose(run("implicit", 500, 0.001)[-1], run("explicit", 500, 0.001)[-1], atol=1e-2)
+    compiled, reference = compiled_and_numpy(lambda: run("implicit", 10, 5.0))
+    assert np.allclose(compiled, reference)
+
+
+def test_optimize_cooling_emergency_step():
+    model = ThermalManagementModel(capacity=50, internal_resistance=0.1, ambient_temperature=25, num_zones=3)
+    model.temperature = np.array([30.0, 50.0, 46.0])
+    strategy = model.optimize_cooling(max_temperature=45.0)
+    assert np.allclose(model.temperature, [30.0, 49.0, 45.0])
+    assert list(strategy) == ["无需冷却", "启用冷却", "启用冷却"]
+    assert model.optimize_cooling(verbose=False) is None
+
+
+def test_reassigned_parameters_take_effect():
+    base = dict(capacity=50, ambient_temperature=25, num_zones=3)
+    model = ThermalManagementModel(internal_resistance=0.1, **base)
+    model.simulate(current=20, time_steps=2, verbose=False)
+    model.temperature[:] = 25.0
+    model.internal_resistance = 0.5
+    model.contact_resistance = 1.0
+    fresh = ThermalManagementModel(internal_resistance=0.5, contact_resistance=1.0, **base)
+    expected = fresh.simulate(current=20, time_steps=10, verbose=False)
+    assert np.allclose(model.simulate(current=20, time_steps=10, verbose=False), expected)
+
+
+def test_float32_dtype(compiled_and_numpy):
+    def run(dtype):
+        model = ThermalManagementModel(
+            capacity=50,
+            internal_resistance=0.1,
+            ambient_temperature=25,
+            num_zones=4,
+            cooling_system=LiquidCooling(),
+            dtype=dtype,
+        )
+        return model.simulate(current=20, time_steps=20, verbose=False, external_heat=[5.0, 0.0, 0.0, 2.0])
+
+    compiled, reference = compiled_and_numpy(lambda: run(np.float32))
+    assert compiled.dtype == reference.dtype == np.float32
+    assert np.allclose(compiled, reference, rtol=0, atol=1e-4)
+    assert np.allclose(compiled, run(np.float64), rtol=0, atol=1e-3)
+
+
+
+@pytest.mark.parametrize("temperature", [np.array([30.0, 30.0, 28.0]), np.array([30, 30, 28]), [30, 30, 28]])
+def test_reassigned_temperature_keeps_model_dtype(compiled_and_numpy, temperature):
+    def run():
+        model = ThermalManagementModel(
+            capacity=50, internal_resistance=0.1, ambient_temperature=25, num_zones=3, dtype=np.float32
+        )
+        model.temperature = temperature
+        history = model.simulate(current=20, time_steps=5, verbose=False)
+        assert model.temperature.dtype == np.float32
+        return history
+
+    compiled, reference = compiled_and_numpy(run)
+    assert compiled.dtype == reference.dtype == np.float32
+    assert np.allclose(compiled, reference, rtol=0, atol=1e-4)
+    assert np.all(compiled[-1] > 28.0)
+
+@pytest.mark.parametrize("scheme", ["explicit", "implicit"])
+def test_sparse_laplacian_for_many_zones(compiled_and_numpy, scheme):
+    num_zones = 60
+    base = dict(capacity=50, internal_resistance=0.1, ambient_temperature=25, num_zones=num_zones)
+    heat = np.linspace(0.0, 10.0, num_zones)
+
+    def run():
+        model = ThermalManagementModel(**base)
+        return model.simulate(current=20, time_steps=10, verbose=False, external_heat=heat, scheme=scheme)
+
+    assert sparse.issparse(ThermalManagementModel(**base)._derived_constants()[0])
+    compiled, reference = compiled_and_numpy(run)
+    assert np.allclose(compiled, reference, rtol=0, atol=1e-9)
+    batch = ThermalManagementModel(**base).simulate_batch(
+        [{}, {"contact_resistance": 0.01}], current=20, time_steps=10, external_heat=heat, scheme=scheme
+    )
+    assert np.allclose(batch[0], compiled, rtol=0, atol=1e-9)
@@ -0,0 +1,52 @@
+import types
+import numpy as np
+import pytest
+from thermal_model.electrochem import p2d
+
+
+class _Simulation:
+    builds = 0
+
+    def __init__(self, model, parameter_values):
+        self.model = model
+        self.parameter_values = parameter_values
+        self.solves = []
+
+    def build(self):
+        type(self).builds += 1
+
+    def solve(self, t_eval, inputs=None):
+        self.solves.append(inputs)
+        heating = types.SimpleNamespace(data=np.array([0.0, 1000.0 * inputs["Current function [A]"]]))
+        return {"Total heating [W.m-3]": heating}
+
+
+class _SPM:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.default_parameter_values = {"Nominal cell capacity [A.h]": 5.0, "Cell volume [m3]": 2e-5}
+
+
+@pytest.fixture
+def stub_pybamm(monkeypatch):
+    monkeypatch.setattr(_Simulation, "builds", 0)
+    monkeypatch.setattr(p2d, "_SIM_CACHE", {})
+    stub = types.SimpleNamespace(lithium_ion=types.SimpleNamespace(SPM=_SPM), Simulation=_Simulation)
+    monkeypatch.setattr(p2d, "pybamm", stub)
+    return stub
+
+
+def test_simulation_is_built_once_and_current_passed_per_solve(stub_pybamm):
+    options = {"thermal": "lumped", "particle": ["Fickian", {"order": 2}]}
+    low = p2d.compute_heat_generation(10.0, num_zones=4, options=options)
+    high = p2d.compute_heat_generation(20.0, num_zones=4, options=dict(options))
+
+    assert _Simulation.builds == 1
+    ((sim, _),) = p2d._SIM_CACHE.values()
+    assert sim.parameter_values["Current function [A]"] == "[input]"
+    assert sim.solves == [{"Current function [A]": 2.0}, {"Current function [A]": 4.0}]
+    assert np.allclose(low, 1000.0 * 2.0 * 2e-5 / 4)
+    assert np.allclose(high, 2 * low)
+
+    p2d.compute_heat_generation(10.0, options={"thermal": "x-full"})
+    assert _Simulation.builds == 2
@@ -0,0 +1,77 @@
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+from thermal_model.visualization import _m4_downsample, plot_temperature_history
+
+
+def test_m4_downsample_keeps_bin_extremes():
+    rng = np.random.default_rng(0)
+    history = rng.normal(size=(1003, 3))
+    selected = _m4_downsample(history, 10)
+    assert selected.shape == (40, 3)
+    assert np.all(np.diff(selected, axis=0) >= 0)
+
+    edges = np.linspace(0, history.shape[0], 11).astype(int)
+    for b in range(10):
+        for zone in range(3):
+            segment = history[edges[b]:edges[b + 1], zone]
+            kept = selected[4 * b:4 * b + 4, zone]
+            assert kept[0] == edges[b] and kept[-1] == edges[b + 1] - 1
+            assert history[kept, zone].min() == segment.min()
+            assert history[kept, zone].max() == segment.max()
+
+
+@pytest.mark.parametrize("max_points", [0, 3, -8])
+def test_too_few_points_per_zone_is_rejected(max_points):
+    with pytest.raises(ValueError, match="max_points_per_zone"):
+        plot_temperature_history(np.zeros((100, 2)), max_points_per_zone=max_points)
+
+
+def test_compiled_m4_matches_numpy(compiled_and_numpy):
+    rng = np.random.default_rng(1)
+    history = rng.normal(size=(5003, 4)).astype(np.float32)
+    history[10:20] = 3.0  # ties resolve to the first occurrence
+    history[250, 1] = np.nan  # NaN line gaps inside a bin, at a bin start, and over a whole bin
+    history[500, 2] = np.nan
+    history[600:700, 3] = np.nan
+    compiled, reference = compiled_and_numpy(lambda: _m4_downsample(history, 50))
+    assert np.array_equal(compiled, reference)
+
+
+def test_plot_data_is_written_as_typed_arrays(tmp_path):
+    rng = np.random.default_rng(0)
+    for zones in (3, 12):
+        path = tmp_path / f"history_{zones}.html"
+        plot_temperature_history(rng.normal(size=(100, zones)), str(path))
+        html = path.read_text(encoding="utf-8")
+        assert '"y":{"dtype":"f4","bdata"' in html
+        assert '"x":{"dtype":' in html
+
+
+def test_single_zone_and_list_histories_are_accepted(tmp_path):
+    path = tmp_path / "single.html"
+    plot_temperature_history(np.linspace(25.0, 40.0, 50), str(path))
+    assert "Zone 0" in path.read_text(encoding="utf-8")
+
+    plot_temperature_history([[25.0, 26.0], [27.0, 28.0]], str(path))
+    assert "Zone 1" in path.read_text(encoding="utf-8")
+
+
+def test_datashader_backend_embeds_png(monkeypatch):
+    pytest.importorskip("datashader")
+    pytest.importorskip("PIL")
+
+    shown = []
+    monkeypatch.setattr(go.Figure, "show", lambda fig: shown.append(fig))
+    rng = np.random.default_rng(0)
+    history = 25.0 + np.cumsum(rng.normal(size=(300_000, 4)), axis=0) * 0.01
+
+    # M4 leaves 4 x 4000 points, well below the rasterization threshold
+    plot_temperature_history(history)
+    assert [trace.type for trace in shown[-1].data] == ["scattergl"] * 4
+
+    plot_temperature_history(history, backend="datashader")
+    (image,) = shown[-1].data
+    assert image.type == "image"
+    assert image.source.startswith("data:image/png;base64,")
+    assert image.z is None
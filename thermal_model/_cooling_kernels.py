@@ -0,0 +1,41 @@
+"""Dispatch from the built-in cooling strategies to their fast paths.
+
+:func:`cooling_kernel` is the single table of strategies that bypass
+:meth:`CoolingSystem.cooling_power`: it returns the ``COOL_*`` code of the
+compiled law in ``_kernels`` together with its constants and evolving state.
+The NumPy path uses the same table to inline the linear laws.
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ._kernels import COOL_LIQUID, COOL_PASSIVE, COOL_PCM
+from .cooling import CoolingSystem, LiquidCooling, PassiveCooling, PCMCooling
+
+# Laws without state, cheap enough to inline as array expressions
+LINEAR_CODES = (COOL_PASSIVE, COOL_LIQUID)
+
+
+def cooling_kernel(system: CoolingSystem) -> Optional[Tuple[int, np.ndarray, np.ndarray]]:
+    """Return ``(code, params, state)`` for ``system``, or None if it has no fast path.
+
+    Only the exact built-in classes are matched; subclasses may override
+    ``cooling_power`` and must go through the Python path.
+    """
+    kind = type(system)
+    if kind is PassiveCooling:
+        return COOL_PASSIVE, np.zeros(0), np.zeros(0)
+    if kind is LiquidCooling:
+        return COOL_LIQUID, np.array([system.htc * system.area, system.coolant_temp], dtype=float), np.zeros(0)
+    if kind is PCMCooling:
+        params = np.array([system.fusion_enthalpy * system.mass, system.phase_temp], dtype=float)
+        return COOL_PCM, params, np.array([system._used_energy], dtype=float)  # pylint: disable=protected-access
+    return None
+
+
+def store_state(system: CoolingSystem, state: np.ndarray) -> None:
+    """Write the kernel ``state`` back onto ``system`` after a compiled run."""
+    if type(system) is PCMCooling:  # pylint: disable=unidiomatic-typecheck
+        system._used_energy = float(state[0])  # pylint: disable=protected-access
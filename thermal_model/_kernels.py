@@ -0,0 +1,190 @@
+"""Compiled time-stepping kernels for the thermal model.
+
+The kernels operate on plain arrays and floats so that the whole time loop
+runs without returning to the interpreter. Numba is optional: without it
+``NUMBA_AVAILABLE`` is False and the model keeps using its NumPy path.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import numba  # type: ignore
+except ImportError:  # pragma: no cover
+    numba = None  # pylint: disable=invalid-name
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def _njit(func=None, **options):
+    """Compile ``func`` with numba when available, otherwise return it unchanged.
+
+    Usable bare or with extra numba options, e.g. ``@_njit(parallel=True)``;
+    options override the ``cache``/``fastmath`` defaults.
+    """
+    if func is None:
+        return lambda f: _njit(f, **options)
+    if numba is None:  # pragma: no cover
+        return func
+    return numba.njit(**{"cache": True, "fastmath": True, **options})(func)
+
+
+# Parallel loop range inside ``_njit(parallel=True)`` kernels; plain range without numba
+prange = numba.prange if numba is not None else range
+
+
+# Cooling laws understood by ``cooling_power``; ``_cooling_kernels`` maps the
+# built-in strategy classes onto them
+COOL_PASSIVE = 0
+COOL_LIQUID = 1
+COOL_PCM = 2
+
+
+@_njit
+def cooling_power(code, T, out, params, state):
+    """Write the cooling power (W) per zone into ``out``.
+
+    ``params`` holds the constants of the law and ``state`` any value that
+    evolves between steps (the latent energy already used by a PCM).
+    """
+    n = T.shape[0]
+    if code == COOL_LIQUID:
+        htc_area = params[0]
+        coolant_temp = params[1]
+        for i in range(n):
+            out[i] = htc_area * (T[i] - coolant_temp)
+    elif code == COOL_PCM:
+        latent_capacity = params[0] - state[0]
+        phase_temp = params[1]
+        n_active = 0
+        if latent_capacity > 0:
+            for i in range(n):
+                if T[i] > phase_temp:
+                    n_active += 1
+        per_zone = latent_capacity / n_active if n_active > 0 else 0.0
+        for i in range(n):
+            out[i] = per_zone if T[i] > phase_temp else 0.0
+        state[0] += per_zone * n_active
+    else:
+        for i in range(n):
+            out[i] = 0.0
+
+
+@_njit
+def run_sim(
+    T,
+    gain,
+    inv_cp,
+    ambient,
+    htc_conv,
+    rad_c,
+    inv_R,
+    R0,
+    arr_coeff,
+    r_lut,
+    r_lut_min,
+    r_lut_step,
+    current,
+    ext_heat,
+    steps,
+    implicit,
+    cool_code,
+    cool_params,
+    cool_state,
+    max_T,
+    history,
+    emergency,
+):
+    """Advance ``T`` in place for ``steps`` steps.
+
+    One step matches ``update_temperature`` followed by ``optimize_cooling``.
+    Temperatures after each step are written to ``history`` and the zones
+    that received emergency cooling to the boolean ``emergency``, both of
+    shape (steps, n).
+
+    ``gain`` is ``dt * degradation / specific_heat`` and ``inv_cp`` the
+    reciprocal specific heat per zone; ``rad_c`` is εσA and ``inv_R`` the
+    reciprocal contact resistance, so the explicit update needs no division.
+    ``cool_code`` selects the cooling law (``COOL_*``, see :func:`cooling_power`).
+    It is a plain integer rather than a function argument so that the compiled
+    kernel stays in numba's on-disk cache across processes.
+    With ``implicit`` set, conduction and surface losses use backward Euler and
+    the tridiagonal system is solved with the Thomas algorithm.
+
+    Returns the I²R heat of the last step (0.0 when ``steps`` is 0), from
+    which the caller fills ``power_loss``.
+    """
+    n = T.shape[0]
+    q_cool = np.empty(n)
+    # Thomas algorithm work arrays (modified upper diagonal and right-hand side)
+    c_mod = np.empty(n)
+    d_mod = np.empty(n)
+    Tak = ambient + 273.15
+    # Explicit scalar reduction: numba emits tighter code than for T.mean().
+    # The mean couples every zone at every step, which rules out temporal
+    # blocking; instead later sums are accumulated in the closing sweep of
+    # the previous step, so no step needs a separate pass for it.
+    total = 0.0
+    for i in range(n):
+        total += T[i]
+    q_int = 0.0
+    for t in range(steps):
+        avg_temp = total / n
+        pos = (avg_temp - r_lut_min) / r_lut_step
+        if 0.0 <= pos <= r_lut.shape[0] - 1:
+            dynamic_r = r_lut[int(pos + 0.5)]
+        else:
+            dynamic_r = R0 * np.exp(arr_coeff * (avg_temp - 25.0))
+        q_int = current * current * dynamic_r
+
+        if implicit:
+            # Forward elimination of (I + g(L + H)) T_new = T + g(P + H T_amb)
+            c_prev = 0.0
+            d_prev = 0.0
+            for i in range(n):
+                Ti = T[i]
+                Tk = Ti + 273.15
+                h_surf = htc_conv + rad_c * (Tk + Tak) * (Tk * Tk + Tak * Tak)
+                g = gain[i]
+                lower = -g * inv_R if i > 0 else 0.0
+                upper = -g * inv_R if i < n - 1 else 0.0
+                neighbours = (i > 0) + (i < n - 1)
+                denom = 1.0 + g * (neighbours * inv_R + h_surf) - lower * c_prev
+                c_prev = upper / denom
+                d_prev = (Ti + g * (q_int + ext_heat[i] + h_surf * ambient) - lower * d_prev) / denom
+                c_mod[i] = c_prev
+                d_mod[i] = d_prev
+            # Back substitution; the unclipped solution feeds the recurrence
+            x = 0.0
+            for i in range(n - 1, -1, -1):
+                x = d_mod[i] - c_mod[i] * x
+                T[i] = min(max(x, ambient), 85.0)
+        else:
+            # Update in place; the old value of the left neighbour is carried in
+            # T_left so every zone still sees the start-of-step field.
+            T_left = T[0]
+            for i in range(n):
+                Ti = T[i]
+                Tk = Ti + 273.15
+                h_rad = rad_c * (Tk + Tak) * (Tk * Tk + Tak * Tak)
+                q = (htc_conv + h_rad) * (Ti - ambient)
+                if i > 0:
+                    q += (Ti - T_left) * inv_R
+                if i < n - 1:
+                    q += (Ti - T[i + 1]) * inv_R
+                T_left = Ti
+                Ti += (q_int + ext_heat[i] - q) * gain[i]
+                # Safety clipping, same bound order as np.clip; lowers to minsd/maxsd
+                T[i] = min(max(Ti, ambient), 85.0)
+        cooling_power(cool_code, T, q_cool, cool_params, cool_state)
+        total = 0.0
+        for i in range(n):
+            Ti = T[i] - q_cool[i] * inv_cp[i]
+            hot = Ti > max_T
+            if hot:
+                Ti -= 1.0  # emergency cooling
+            T[i] = Ti
+            total += Ti
+            history[t, i] = Ti
+            emergency[t, i] = hot
+    return q_int
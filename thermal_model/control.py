@@ -3,14 +3,26 @@ from __future__ import annotations
 
 from typing import Optional
 
-import cvxpy as cp
 import numpy as np
+import osqp
+from scipy import sparse
+from scipy.linalg import solve_triangular
+from scipy.optimize import nnls
 
 from .cooling import CoolingSystem, LiquidCooling
 
+_OSQP_SOLVED = (osqp.SolverStatus.OSQP_SOLVED, osqp.SolverStatus.OSQP_SOLVED_INACCURATE)
+
 
 class MPCController:
-    """Linear MPC minimizing cooling power while respecting temperature constraints."""
+    """Linear MPC minimizing cooling power while respecting temperature constraints.
+
+    Zones decouple and the only state constraints are upper temperature
+    limits, so by default the optimum is found in closed form (see
+    :meth:`_solve_lq`). The general QP is solved with OSQP when the 0..20 K
+    bound on delta binds, when the per-step cooling factor
+    ``k = htc*area*dt/1000`` exceeds 1, or always with ``slow_mode=True``.
+    """
 
     def __init__(
         self,
@@ -19,27 +31,101 @@ class MPCController:
         dt: float = 1.0,
         htc: float = 50.0,
         area: float = 0.005,
+        slow_mode: bool = False,
     ):
         self.horizon = horizon
         self.max_temp = max_temp
         self.dt = dt
         self.htc = htc
         self.area = area
+        self.slow_mode = slow_mode
 
-    def compute_actions(self, temperatures: np.ndarray, ambient: float) -> CoolingSystem:
+        # Each step: temp <- a*temp + k*(ambient - delta) with k = h*A*dt/1000.
+        # Unrolled over the horizon, temp_{t+1} = decay[t]*T0 + ambient_gain[t]*ambient
+        # + sum_s gain[t, s]*delta_s, so the constraints are linear in delta.
+        k = htc * area * dt / 1000
+        a = 1.0 - k
+        steps = np.arange(horizon)
+        self._decay = a ** (steps + 1)
+        self._ambient_gain = k * np.cumsum(a ** steps)
+        lag = steps[:, None] - steps[None, :]
+        self._gain = np.where(lag >= 0, -k * a ** np.maximum(lag, 0), 0.0)
+        # The closed form needs cooling authority (k > 0) to invert the dynamics and
+        # a >= 0 so that -gain is non-negative; otherwise only the QP is exact
+        self._closed_form = 0.0 < k <= 1.0
+
+        self._solver: Optional[osqp.OSQP] = None
+        self._zones = 0
+
+    def _setup(self, zones: int) -> None:
+        """Build the fixed QP structure for ``zones`` and cache the OSQP solver."""
+        n = self.horizon * zones
+        # Decision vector is delta flattened as [t, zone]; cost sum(delta^2) = 0.5 x'(2I)x
+        P = sparse.identity(n, format="csc") * 2.0
+        A = sparse.vstack(
+            [sparse.kron(sparse.csc_matrix(self._gain), sparse.identity(zones)), sparse.identity(n)],
+            format="csc",
+        )
+        l, u = self._bounds(np.zeros(zones), 0.0)
+        self._solver = osqp.OSQP()
+        self._solver.setup(P, np.zeros(n), A, l, u, verbose=False, eps_abs=1e-5, eps_rel=1e-5)
+        self._zones = zones
+
+    def _free_response(self, temperatures: np.ndarray, ambient: float) -> np.ndarray:
+        """Temperatures over the horizon with delta = 0, shape (horizon, zones)."""
+        return self._decay[:, None] * temperatures[None, :] + self._ambient_gain[:, None] * ambient
+
+    def _bounds(self, temperatures: np.ndarray, ambient: float):
+        """Return OSQP ``(l, u)`` for the current state."""
+        free = self._free_response(temperatures, ambient)
+        n = free.size
+        l = np.concatenate([np.full(n, -np.inf), np.zeros(n)])
+        u = np.concatenate([(self.max_temp - free).ravel(), np.full(n, 20.0)])
+        return l, u
+
+    def _solve_lq(self, temperatures: np.ndarray, ambient: float) -> Optional[np.ndarray]:
+        """Closed-form optimum ignoring the 20 K cap; None if the cap would bind.
+
+        Per zone the problem is min ||d||² s.t. M d >= b with M = -gain lower
+        triangular and, for 0 < k <= 1, non-negative. Its dual reduces to the
+        non-negative least-squares problem min_{λ>=0} ||Mᵀλ - M⁻¹b||², and
+        d = Mᵀλ >= 0, so the lower bound holds automatically. Zones already within the limit
+        need no cooling and are skipped.
+        """
+        excess = self._free_response(temperatures, ambient) - self.max_temp
+        delta = np.zeros_like(excess)
+        hot = np.flatnonzero(np.any(excess > 0, axis=0))
+        if hot.size == 0:
+            return delta
+        M = -self._gain
+        target = solve_triangular(M, excess[:, hot], lower=True)
+        for col, zone in enumerate(hot):
+            lam, _ = nnls(M.T, target[:, col])
+            delta[:, zone] = M.T @ lam
+        if delta.max() > 20.0:
+            return None
+        return delta
+
+    def _solve_qp(self, temperatures: np.ndarray, ambient: float) -> np.ndarray:
+        """Solve the full box-constrained QP with the cached OSQP instance."""
         zones = temperatures.size
-        # Decision variables: coolant_temp deviation below ambient for each step
-        delta = cp.Variable((self.horizon, zones))
-        cost = cp.sum(cp.square(delta))
-        constraints = []
-        temp = temperatures.copy()
-        for t in range(self.horizon):
-            # Cooling power proportional to ΔT between cell and coolant
-            power = self.htc * self.area * (temp - (ambient - delta[t]))
-            temp = temp - (power * self.dt) / 1000  # simplistic thermal mass
-            constraints += [temp <= self.max_temp, delta[t] >= 0, delta[t] <= 20]
-        prob = cp.Problem(cp.Minimize(cost), constraints)
-        prob.solve(solver=cp.OSQP)
+        if self._solver is None or zones != self._zones:
+            self._setup(zones)
+        # Only the bounds depend on the state; OSQP warm-starts from the last solution
+        l, u = self._bounds(temperatures, ambient)
+        self._solver.update(l=l, u=u)
+        result = self._solver.solve(raise_error=False)
+        if result.info.status_val not in _OSQP_SOLVED:
+            raise RuntimeError(f"MPC problem could not be solved: {result.info.status}")
+        return result.x.reshape(self.horizon, zones)
+
+    def compute_actions(self, temperatures: np.ndarray, ambient: float) -> CoolingSystem:
+        temperatures = np.asarray(temperatures, dtype=float)
+        delta = None
+        if not self.slow_mode and self._closed_form:
+            delta = self._solve_lq(temperatures, ambient)
+        if delta is None:
+            delta = self._solve_qp(temperatures, ambient)
         # Use first-step delta to create LiquidCooling with lowered coolant temp
-        coolant_temp = ambient - delta.value[0]
-        return LiquidCooling(htc=self.htc, coolant_temp=float(np.mean(coolant_temp)), area_per_zone=self.area) 
\ No newline at end of file
+        coolant_temp = ambient - delta[0]
+        return LiquidCooling(htc=self.htc, coolant_temp=float(np.mean(coolant_temp)), area_per_zone=self.area)
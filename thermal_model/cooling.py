@@ -54,10 +54,12 @@ class PCMCooling(CoolingSystem):
     def cooling_power(self, temperatures: np.ndarray) -> np.ndarray:
         power = np.zeros_like(temperatures)
         latent_capacity = self.fusion_enthalpy * self.mass - self._used_energy
+        if latent_capacity <= 0:
+            return power
         mask = temperatures > self.phase_temp
+        n_active = np.count_nonzero(mask)
         # Remove heat limited by remaining latent capacity (simplified per step)
-        if latent_capacity > 0 and np.any(mask):
-            per_zone = latent_capacity / max(np.count_nonzero(mask), 1)
-            power[mask] = per_zone
-            self._used_energy += per_zone * np.count_nonzero(mask)
-        return power 
\ No newline at end of file
+        per_zone = latent_capacity / max(n_active, 1)
+        np.copyto(power, per_zone, where=mask)
+        self._used_energy += per_zone * n_active
+        return power
\ No newline at end of file
@@ -1,7 +1,122 @@
+import copy
+
 import numpy as np
-from typing import List, Union, Optional
+from scipy.linalg import solve_banded
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+from . import _cooling_kernels, _kernels
 from .cooling import CoolingSystem, PassiveCooling
 
+_KELVIN = 273.15
+
+# Constructor arguments that simulate_batch can vary per case, mapped to attributes
+_BATCH_ATTRIBUTES: Dict[str, str] = {
+    "internal_resistance": "internal_resistance",
+    "ambient_temperature": "ambient_temperature",
+    "surface_area": "surface_area",
+    "contact_resistance": "contact_resistance",
+    "arrhenius_coeff": "arrhenius_coeff",
+    "convective_heat_transfer_coefficient": "convective_htc",
+    "radiative_emissivity": "emissivity",
+    "stefan_boltzmann_constant": "sigma",
+}
+# Constructor arguments that do not enter the time stepping
+_BATCH_INERT = frozenset({"capacity", "heat_capacity", "thermal_conductivity"})
+BATCH_PARAMETERS = frozenset(_BATCH_ATTRIBUTES) | _BATCH_INERT
+
+# Tabulated Arrhenius factor for the internal resistance: 0.1 °C grid over [-50, 150] °C
+_R_LUT_MIN = -50.0
+_R_LUT_STEP = 0.1
+_R_LUT_SIZE = 2001
+
+# Default temperature (°C) above which zones get 1 K of emergency cooling per step
+_EMERGENCY_TEMPERATURE = 45.0
+
+# Above this many zones the conduction operator is stored as a sparse matrix
+_SPARSE_LAPLACIAN_MIN_ZONES = 50
+
+
+# Temperatures of the lookup-table grid
+_R_LUT_TEMPS = _R_LUT_MIN + _R_LUT_STEP * np.arange(_R_LUT_SIZE)
+
+
+def _conduction_laplacian(num_zones: int):
+    """Return the unit conduction operator ``L``; ``(L @ T) / Rc`` is q_cond (W).
+
+    Zones form a 1-D chain: each interface contributes ``1`` to the diagonal
+    of both neighbours and ``-1`` off-diagonal, so edge zones carry no flux
+    past the pack boundary.
+    """
+    diag = np.zeros(num_zones)
+    diag[:-1] += 1.0
+    diag[1:] += 1.0
+    off = -np.ones(num_zones - 1)
+    if num_zones > _SPARSE_LAPLACIAN_MIN_ZONES:
+        from scipy import sparse
+
+        return sparse.diags([off, diag, off], [-1, 0, 1], format="csr")
+    return np.diag(diag) + np.diag(off, 1) + np.diag(off, -1)
+
+
+def _lut_temperature(avg_temp: np.ndarray) -> np.ndarray:
+    """Snap mean temperatures to the ``_R_LUT_TEMPS`` grid, as the table lookup does.
+
+    Values outside the grid pass through unchanged (the exact-exp fallback).
+    """
+    pos = (avg_temp - _R_LUT_MIN) / _R_LUT_STEP
+    inside = (pos >= 0.0) & (pos <= _R_LUT_SIZE - 1)
+    index = np.where(inside, pos + 0.5, 0.0).astype(np.intp)
+    return np.where(inside, _R_LUT_TEMPS[index], avg_temp)
+
+
+# The helpers below take a field ``T`` of shape (num_zones,) or (n_cases, num_zones);
+# parameters are scalars or broadcast against ``T`` (e.g. shape (n_cases, 1)).
+
+
+def _surface_htc(T: np.ndarray, T_amb, htc, rad_c) -> np.ndarray:
+    """Convective plus radiative heat transfer coefficient per zone (W/K).
+
+    Radiation is evaluated in Kelvin and factored as h_rad * (T - T_amb) with
+    h_rad = εσA (Tk + Tak)(Tk² + Tak²), which equals εσA (Tk⁴ - Tak⁴).
+    """
+    Tk = T + _KELVIN
+    Tak = T_amb + _KELVIN
+    return htc + rad_c * (Tk + Tak) * (Tk * Tk + Tak * Tak)
+
+
+def _heat_losses(T: np.ndarray, T_amb, htc, rad_c, inv_Rc, laplacian) -> np.ndarray:
+    """Conduction to neighbours plus convection and radiation to ambient (W per zone)."""
+    q_cond = (laplacian @ T.T).T * inv_Rc
+    return q_cond + _surface_htc(T, T_amb, htc, rad_c) * (T - T_amb)
+
+
+def _heat_balance_increment(T, q_in, gain, T_amb, htc, rad_c, inv_Rc, laplacian, scheme="explicit"):
+    """Return the ΔT of one step for heat input ``q_in`` (W per zone).
+
+    ``gain`` is ``time_step * degradation_factor / specific_heat`` (K/J).
+    With ``scheme="implicit"`` conduction and the surface losses are taken
+    at the end of the step (backward Euler), using the surface coefficient
+    of the current field. Cases do not couple, so all of them are stacked
+    into one block-tridiagonal system and solved in a single banded solve.
+    """
+    if scheme == "explicit":
+        return (q_in - _heat_losses(T, T_amb, htc, rad_c, inv_Rc, laplacian)) * gain
+    if scheme != "implicit":
+        raise ValueError(f"Unknown integration scheme: {scheme}")
+
+    # (I + g(L/Rc + H)) T_new = T + g(P + H T_amb), in solve_banded's (1, 1) layout
+    h_surf = _surface_htc(T, T_amb, htc, rad_c)
+    coupling = np.broadcast_to(-gain * inv_Rc, T.shape)
+    upper = coupling.copy()
+    upper[..., -1] = 0.0  # no coupling into the next case
+    lower = coupling.copy()
+    lower[..., 0] = 0.0
+    ab = np.zeros((3, T.size))
+    ab[0, 1:] = upper.ravel()[:-1]
+    ab[1] = np.broadcast_to(1.0 + gain * (laplacian.diagonal() * inv_Rc + h_surf), T.shape).ravel()
+    ab[2, :-1] = lower.ravel()[1:]
+    rhs = T + gain * (q_in + h_surf * T_amb)
+    return solve_banded((1, 1), ab, np.ravel(rhs)).reshape(T.shape) - T
+
 
 class ThermalManagementModel:
     """Advanced thermal management model for battery packs.
@@ -26,6 +141,7 @@ class ThermalManagementModel:
         stefan_boltzmann_constant: float = 5.67e-8,
         num_zones: int = 3,
         cooling_system: Optional[CoolingSystem] = None,
+        dtype: Union[str, np.dtype, type] = np.float64,
     ) -> None:
         """Initialize the thermal model.
 
@@ -41,11 +157,13 @@ class ThermalManagementModel:
         radiative_emissivity: 辐射率 (dimensionless)
         stefan_boltzmann_constant: 斯特藩常数 (W/m²·K⁴)
         num_zones: 分区数量
+        dtype: 温度等数组的浮点类型；大批量扫频可用 float32 减半内存带宽
         """
         self.capacity = capacity
         self.internal_resistance = internal_resistance
         self.ambient_temperature = ambient_temperature
-        self.temperature = np.full(num_zones, ambient_temperature, dtype=float)
+        self._dtype = np.dtype(dtype)
+        self.temperature = np.full(num_zones, ambient_temperature, dtype=self._dtype)
 
         # Thermal parameters
         self.heat_capacity = heat_capacity
@@ -60,44 +178,186 @@ class ThermalManagementModel:
         self.cooling_system: CoolingSystem = cooling_system or PassiveCooling()
 
         # Dynamic arrays per zone
-        self.power_loss = np.zeros(num_zones)
-        self.cooling_efficiency = np.zeros(num_zones)
-        self.specific_heat = np.full(num_zones, 1000.0)  # 可按材料区分
-        self.degradation_factor = np.ones(num_zones)
-        self.temperature_gradient = np.zeros(num_zones)
+        self.power_loss = np.zeros(num_zones, dtype=self._dtype)
+        self.cooling_efficiency = np.zeros(num_zones, dtype=self._dtype)
+        self.specific_heat = np.full(num_zones, 1000.0, dtype=self._dtype)  # 可按材料区分
+        self.degradation_factor = np.ones(num_zones, dtype=self._dtype)
+        self.temperature_gradient = np.zeros(num_zones, dtype=self._dtype)
+
+        # Hot-path constants derived from the parameters above (see _derived_constants)
+        self._derived_key: Optional[tuple] = None
+        self._derived: tuple = ()
 
     # ---------------------------------------------------------------------
     # Core physics helpers
     # ---------------------------------------------------------------------
+    def _derived_constants(self) -> Tuple[np.ndarray, np.ndarray, float, float]:
+        """Return ``(laplacian, r_lut, rad_c, inv_Rc)`` for the current parameters.
+
+        ``laplacian`` is the unit conduction operator, ``r_lut`` the
+        internal resistance on the ``_R_LUT_*`` temperature grid, ``rad_c`` is
+        εσA and ``inv_Rc`` the reciprocal contact resistance. They are rebuilt
+        whenever a parameter they derive from has been reassigned, so changing
+        e.g. ``contact_resistance`` on a live model takes effect immediately.
+        """
+        key = (
+            self.num_zones,
+            self.contact_resistance,
+            self.internal_resistance,
+            self.arrhenius_coeff,
+            self.emissivity,
+            self.sigma,
+            self.surface_area,
+        )
+        if key != self._derived_key:
+            laplacian = _conduction_laplacian(self.num_zones).astype(self._dtype)
+            r_lut = self.internal_resistance * np.exp(self.arrhenius_coeff * (_R_LUT_TEMPS - 25.0))
+            rad_c = self.emissivity * self.sigma * self.surface_area
+            self._derived = (laplacian, r_lut, rad_c, 1.0 / self.contact_resistance)
+            self._derived_key = key
+        return self._derived
+
     def calculate_internal_heat_generation(self, current: float) -> float:
         """Return I²R heat generation with temperature-dependent internal resistance."""
-        avg_temp = float(np.mean(self.temperature))
-        dynamic_r = self.internal_resistance * np.exp(self.arrhenius_coeff * (avg_temp - 25.0))
+        avg_temp = float(self.temperature.sum()) / self.num_zones
+        # Nearest grid point of the lookup table; exact exp() outside its range
+        pos = (avg_temp - _R_LUT_MIN) / _R_LUT_STEP
+        if 0.0 <= pos <= _R_LUT_SIZE - 1:
+            dynamic_r = self._derived_constants()[1][int(pos + 0.5)]
+        else:
+            dynamic_r = self.internal_resistance * np.exp(self.arrhenius_coeff * (avg_temp - 25.0))
         return (current ** 2) * dynamic_r
 
+    def _heat_losses(self) -> np.ndarray:
+        """Compute total heat losses for all zones at once (W per zone)."""
+        laplacian, _, rad_c, inv_Rc = self._derived_constants()
+        return _heat_losses(
+            self.temperature, self.ambient_temperature, self.convective_htc, rad_c, inv_Rc, laplacian
+        )
+
     def _zone_heat_losses(self, idx: int) -> float:
         """Compute total heat losses for a single zone (W)."""
-        # Conduction to neighbours
-        q_cond_left = (
-            (self.temperature[idx] - self.temperature[idx - 1]) / self.contact_resistance
-            if idx > 0
-            else 0.0
-        )
-        q_cond_right = (
-            (self.temperature[idx] - self.temperature[idx + 1]) / self.contact_resistance
-            if idx < self.num_zones - 1
-            else 0.0
+        return float(self._heat_losses()[idx])
+
+    def _external_heat_array(self, external_heat: Union[float, np.ndarray, None]) -> np.ndarray:
+        """Normalize ``external_heat`` to a per-zone array (W)."""
+        if external_heat is None:
+            return np.zeros(self.num_zones, dtype=self._dtype)
+        if np.isscalar(external_heat):
+            return np.full(self.num_zones, float(external_heat), dtype=self._dtype)
+        ext = np.asarray(external_heat, dtype=self._dtype)
+        if ext.size != self.num_zones:
+            raise ValueError("external_heat length must match num_zones")
+        return ext.reshape(self.num_zones)
+
+    def _simulate_compiled(
+        self,
+        current: float,
+        time_steps: int,
+        gain: np.ndarray,
+        inv_cp: np.ndarray,
+        ext: np.ndarray,
+        cooling: Tuple[int, np.ndarray, np.ndarray],
+        history: np.ndarray,
+        emergency: np.ndarray,
+        scheme: str = "explicit",
+    ) -> None:
+        """Run :meth:`simulate` through the compiled kernel, filling the output arrays."""
+        cool_code, cool_params, cool_state = cooling
+        _, r_lut, rad_c, inv_Rc = self._derived_constants()
+        q_int = _kernels.run_sim(
+            self.temperature,
+            np.ascontiguousarray(gain, dtype=self._dtype),
+            np.ascontiguousarray(inv_cp, dtype=self._dtype),
+            float(self.ambient_temperature),
+            float(self.convective_htc),
+            float(rad_c),
+            float(inv_Rc),
+            float(self.internal_resistance),
+            float(self.arrhenius_coeff),
+            r_lut,
+            _R_LUT_MIN,
+            _R_LUT_STEP,
+            float(current),
+            ext,
+            int(time_steps),
+            scheme == "implicit",
+            cool_code,
+            cool_params,
+            cool_state,
+            _EMERGENCY_TEMPERATURE,
+            history,
+            emergency,
         )
+        _cooling_kernels.store_state(self.cooling_system, cool_state)
+        if time_steps > 0:
+            # Same per-zone heat input as the last NumPy step leaves behind
+            np.add(q_int, ext, out=self.power_loss)
 
-        # Convection with ambient
-        q_conv = self.convective_htc * (self.temperature[idx] - self.ambient_temperature)
+    def _temperature_increment(
+        self,
+        current: float,
+        gain: np.ndarray,
+        ext: np.ndarray,
+        scheme: str = "explicit",
+    ) -> np.ndarray:
+        """Update ``power_loss`` and return the heat-balance ΔT per zone.
 
-        # Radiation (converted to °C^4 ≈ K^4 for small ΔT this is acceptable)
-        q_rad = self.emissivity * self.sigma * self.surface_area * (
-            self.temperature[idx] ** 4 - self.ambient_temperature ** 4
+        ``gain`` is ``time_step * degradation_factor / specific_heat`` (K/J) and
+        ``ext`` the per-zone external heat from :meth:`_external_heat_array`;
+        see :func:`_heat_balance_increment` for ``scheme``.
+        """
+        # Internal heat (I^2R) plus externally supplied heat sources (e.g., from P2D electrochemical model)
+        np.add(self.calculate_internal_heat_generation(current), ext, out=self.power_loss)
+        laplacian, _, rad_c, inv_Rc = self._derived_constants()
+        return _heat_balance_increment(
+            self.temperature,
+            self.power_loss,
+            gain,
+            self.ambient_temperature,
+            self.convective_htc,
+            rad_c,
+            inv_Rc,
+            laplacian,
+            scheme,
         )
 
-        return q_cond_left + q_cond_right + q_conv + q_rad
+    def _step(
+        self,
+        current: float,
+        gain: np.ndarray,
+        inv_cp: np.ndarray,
+        ext: np.ndarray,
+        cooling: Optional[Tuple[int, np.ndarray, np.ndarray]],
+        max_temperature: float = _EMERGENCY_TEMPERATURE,
+        scheme: str = "explicit",
+    ) -> np.ndarray:
+        """Fused ``update_temperature`` + ``optimize_cooling`` for one step.
+
+        The new field is built in a single temporary and written back to
+        ``self.temperature`` once. Linear cooling laws are inlined instead of
+        dispatching to ``cooling_power``. ``gain``, ``inv_cp`` (1/specific
+        heat) and ``cooling`` (from :func:`_cooling_kernels.cooling_kernel`)
+        are step invariants precomputed by the caller.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of zones that received emergency cooling.
+        """
+        T = self.temperature + self._temperature_increment(current, gain, ext, scheme)
+        np.clip(T, self.ambient_temperature, 85.0, out=T)
+
+        if cooling is None or cooling[0] not in _cooling_kernels.LINEAR_CODES:
+            T -= self.cooling_system.cooling_power(T) * inv_cp
+        elif cooling[0] == _kernels.COOL_LIQUID:
+            cooling_htc_area, coolant_temp = cooling[1]
+            T -= cooling_htc_area * (T - coolant_temp) * inv_cp
+
+        emergency = T > max_temperature
+        T -= emergency
+        self.temperature[:] = T
+        return emergency
 
     # ---------------------------------------------------------------------
     # Public API
@@ -107,54 +367,46 @@ class ThermalManagementModel:
         current: float,
         time_step: float,
         external_heat: Union[float, np.ndarray, None] = None,
+        scheme: str = "explicit",
     ) -> np.ndarray:
         """Update temperature distribution for a single time step.
 
+        ``scheme`` selects explicit (default) or implicit (backward Euler)
+        integration of conduction and surface losses.
+
         Returns
         -------
         np.ndarray
             Updated temperature field per zone.
         """
-        # Internal heat (I^2R) plus optional externally supplied heat sources (e.g., from P2D electrochemical model)
-        self.power_loss.fill(self.calculate_internal_heat_generation(current))
-        if external_heat is not None:
-            # Allow scalar or per-zone array
-            if np.isscalar(external_heat):
-                self.power_loss += external_heat  # broadcast to all zones
-            else:
-                ext = np.asarray(external_heat, dtype=float)
-                if ext.size != self.num_zones:
-                    raise ValueError("external_heat length must match num_zones")
-                self.power_loss += ext
-
-        for i in range(self.num_zones):
-            total_losses = self._zone_heat_losses(i)
-            dT = (self.power_loss[i] - total_losses) * time_step / self.specific_heat[i]
-            self.temperature[i] += dT * self.degradation_factor[i]
-            # Safety clipping
-            self.temperature[i] = np.clip(self.temperature[i], self.ambient_temperature, 85.0)
+        ext = self._external_heat_array(external_heat)
+        gain = time_step * self.degradation_factor / self.specific_heat
+        self.temperature += self._temperature_increment(current, gain, ext, scheme)
+        # Safety clipping
+        np.clip(self.temperature, self.ambient_temperature, 85.0, out=self.temperature)
         return self.temperature
 
-    def optimize_cooling(self, max_temperature: float = 45.0) -> List[str]:
-        """Apply cooling system and fallback heuristic if needed."""
+    def optimize_cooling(
+        self, max_temperature: float = _EMERGENCY_TEMPERATURE, verbose: bool = True
+    ) -> Optional[np.ndarray]:
+        """Apply cooling system and fallback heuristic if needed.
+
+        Returns the per-zone strategy labels, or None with ``verbose=False``.
+        """
         # Apply configured cooling system to compute heat removal (W), convert to ΔT
         cooling_power = self.cooling_system.cooling_power(self.temperature)
         # Cooling reduces temperature proportionally to power and step (assume 1s here for simplicity)
         self.temperature -= cooling_power / self.specific_heat
 
-        # Fallback heuristic if still above limit
-        strategy: List[str] = []
-        for i in range(self.num_zones):
-            if self.temperature[i] > max_temperature:
-                self.temperature[i] -= 1.0  # additional emergency cooling
-                strategy.append("启用冷却")
-            else:
-                strategy.append("无需冷却")
-        return strategy
+        # Fallback heuristic if still above limit: additional emergency cooling
+        mask = self.temperature > max_temperature
+        self.temperature -= mask.astype(self.temperature.dtype)
+        if not verbose:
+            return None
+        return np.where(mask, "启用冷却", "无需冷却")
 
     def check_battery_status(self) -> np.ndarray:
-        status = ["电池过热" if T > 60 else "正常" for T in self.temperature]
-        return np.array(status)
+        return np.where(self.temperature > 60, "电池过热", "正常")
 
     def simulate(
         self,
@@ -163,6 +415,7 @@ class ThermalManagementModel:
         time_step: float = 1.0,
         verbose: bool = True,
         external_heat: Union[float, np.ndarray, None] = None,
+        scheme: str = "explicit",
     ) -> np.ndarray:
         """Run a time-stepping simulation.
 
@@ -175,23 +428,131 @@ class ThermalManagementModel:
         time_step : float
             Length of each step (s).
         verbose : bool
-            If True, print per-step log.
+            If True, print the per-step log once the run has finished.
         external_heat : float | np.ndarray | None
             Constant extra heat source per zone (W). For example, derived from
             an electrochemical model.
+        scheme : str
+            ``"explicit"`` (forward Euler) or ``"implicit"`` (backward Euler on
+            conduction and surface losses, one tridiagonal solve per step).
+            The implicit scheme stays stable for much larger ``time_step``.
         Returns
         -------
         np.ndarray
             Temperature history with shape (time_steps, num_zones).
         """
-        history: List[np.ndarray] = []
+        if scheme not in ("explicit", "implicit"):
+            raise ValueError(f"Unknown integration scheme: {scheme}")
+        # A reassigned temperature (list, other dtype) is brought back to the
+        # model dtype so both paths integrate and return the same precision;
+        # numba compiles one specialization per array dtype (float64 / float32)
+        self.temperature = np.ascontiguousarray(self.temperature, dtype=self._dtype)
+        # Step invariants, computed once per run
+        ext = self._external_heat_array(external_heat)
+        inv_cp = 1.0 / self.specific_heat
+        gain = time_step * self.degradation_factor * inv_cp
+        history = np.empty((time_steps, self.num_zones), dtype=self._dtype)
+        emergency = np.empty((time_steps, self.num_zones), dtype=bool)
+        cooling = _cooling_kernels.cooling_kernel(self.cooling_system)
+        if _kernels.NUMBA_AVAILABLE and cooling is not None:
+            self._simulate_compiled(current, time_steps, gain, inv_cp, ext, cooling, history, emergency, scheme)
+        else:
+            for t in range(time_steps):
+                emergency[t] = self._step(current, gain, inv_cp, ext, cooling, scheme=scheme)
+                history[t] = self.temperature
+        if verbose:
+            self._print_log(history, emergency)
+        return history
+
+    @staticmethod
+    def _print_log(history: np.ndarray, emergency: np.ndarray) -> None:
+        """Render the per-step log of a finished run in one pass."""
+        status = np.where(history > 60, "电池过热", "正常")
+        cooling = np.where(emergency, "启用冷却", "无需冷却")
+        print(
+            "\n".join(
+                f"时间: {t}s, 电池区域温度: {history[t]}, 状态: {status[t]}, 冷却策略: {cooling[t].tolist()}"
+                for t in range(history.shape[0])
+            )
+        )
+
+    def simulate_batch(
+        self,
+        params: Sequence[Mapping[str, float]],
+        current: float,
+        time_steps: int = 10,
+        time_step: float = 1.0,
+        external_heat: Union[float, np.ndarray, None] = None,
+        scheme: str = "explicit",
+    ) -> np.ndarray:
+        """Simulate many parameter variants of this model in one vectorized loop.
+
+        The temperature field carries a leading case axis, so every step is a
+        single set of array operations over ``(n_cases, num_zones)``. The model
+        itself (temperature, cooling state) is left untouched.
+
+        Parameters
+        ----------
+        params : sequence of mappings
+            One mapping per case with constructor argument overrides; keys must
+            be in ``BATCH_PARAMETERS``. Cases start from the current temperature
+            field, or from their own ambient when ``ambient_temperature`` is set.
+        current, time_steps, time_step, external_heat, scheme
+            As in :meth:`simulate`.
+
+        Returns
+        -------
+        np.ndarray
+            Temperature histories with shape (n_cases, time_steps, num_zones).
+        """
+        if scheme not in ("explicit", "implicit"):
+            raise ValueError(f"Unknown integration scheme: {scheme}")
+        n_cases = len(params)
+        values = {}
+        for name, attr in _BATCH_ATTRIBUTES.items():
+            values[name] = np.full((n_cases, 1), float(getattr(self, attr)), dtype=self._dtype)
+        for case, overrides in enumerate(params):
+            unknown = set(overrides) - BATCH_PARAMETERS
+            if unknown:
+                raise ValueError(f"Cannot vary {sorted(unknown)} in simulate_batch")
+            for name, value in overrides.items():
+                if name in values:
+                    values[name][case] = value
+
+        R0 = values["internal_resistance"]
+        T_amb = values["ambient_temperature"]
+        inv_Rc = 1.0 / values["contact_resistance"]
+        arrhenius = values["arrhenius_coeff"]
+        htc = values["convective_heat_transfer_coefficient"]
+        rad_c = values["radiative_emissivity"] * values["stefan_boltzmann_constant"] * values["surface_area"]
+        laplacian = self._derived_constants()[0]
+
+        T = np.repeat(self.temperature[None, :].astype(self._dtype), n_cases, axis=0)
+        for case, overrides in enumerate(params):
+            if "ambient_temperature" in overrides:
+                T[case] = overrides["ambient_temperature"]
+        ext = self._external_heat_array(external_heat)
+        inv_cp = 1.0 / self.specific_heat
+        gain = time_step * self.degradation_factor * inv_cp
+
+        # Stateful cooling strategies get an independent copy per case
+        cooling = _cooling_kernels.cooling_kernel(self.cooling_system)
+        linear_cooling = cooling is not None and cooling[0] in _cooling_kernels.LINEAR_CODES
+        if not linear_cooling:
+            systems = [copy.deepcopy(self.cooling_system) for _ in range(n_cases)]
+
+        history = np.empty((n_cases, time_steps, self.num_zones), dtype=self._dtype)
         for t in range(time_steps):
-            temps = self.update_temperature(current, time_step=time_step, external_heat=external_heat)
-            cooling = self.optimize_cooling()
-            status = self.check_battery_status()
-            if verbose:
-                print(
-                    f"时间: {t}s, 电池区域温度: {temps}, 状态: {status}, 冷却策略: {cooling}"
-                )
-            history.append(temps.copy())
-        return np.stack(history) 
\ No newline at end of file
+            # Same Arrhenius table grid as calculate_internal_heat_generation
+            avg_temp = T.sum(axis=1, keepdims=True) / self.num_zones
+            q_int = current ** 2 * R0 * np.exp(arrhenius * (_lut_temperature(avg_temp) - 25.0))
+            T = T + _heat_balance_increment(T, q_int + ext, gain, T_amb, htc, rad_c, inv_Rc, laplacian, scheme)
+            T = np.clip(T, T_amb, 85.0)
+            if not linear_cooling:
+                T -= np.stack([s.cooling_power(row) for s, row in zip(systems, T)]) * inv_cp
+            elif cooling[0] == _kernels.COOL_LIQUID:
+                cooling_htc_area, coolant_temp = cooling[1]
+                T -= cooling_htc_area * (T - coolant_temp) * inv_cp
+            T -= T > _EMERGENCY_TEMPERATURE  # emergency cooling
+            history[:, t] = T
+        return history
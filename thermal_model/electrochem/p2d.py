@@ -6,7 +6,7 @@ Future work: run time-resolved coupling and heterogeneous heat mapping.
 """
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import numpy as np
 
@@ -20,6 +20,51 @@ class PybammNotInstalledError(RuntimeError):
     """Raised when pybamm is required but not installed."""
 
 
+# Built simulations keyed by model name and constructor kwargs. Building
+# (discretization + solver setup) dominates the cost of a short solve.
+_SIM_CACHE: Dict[Tuple[str, Any], Tuple[Any, float]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable version of (possibly nested) model kwargs."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _cached_simulation(model_name: str, model_kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    """Return a built ``(simulation, cell_volume)`` for the model, building it once.
+
+    The applied current is an input parameter, so the same built simulation
+    serves every call; pass it via ``inputs`` when solving.
+    """
+    key = (model_name.upper(), _freeze(model_kwargs))
+    if key in _SIM_CACHE:
+        return _SIM_CACHE[key]
+
+    # Select model
+    if model_name.upper() == "SPM":
+        model = pybamm.lithium_ion.SPM(**model_kwargs)
+    elif model_name.upper() == "DFN":
+        model = pybamm.lithium_ion.DFN(**model_kwargs)
+    else:
+        raise ValueError(f"Unsupported model_name: {model_name}")
+
+    # Parameter values and simulation; the constant current is supplied per solve
+    param = model.default_parameter_values
+    param["Current function [A]"] = "[input]"
+
+    sim = pybamm.Simulation(model, parameter_values=param)
+    sim.build()
+
+    # Cell volume parameter; fallback approximate cylindrical cell
+    cell_volume = param.get("Cell volume [m3]") or (param["Electrode width [m]"] * param["Electrode height [m]"] * param["Electrode thickness [m]"])
+    _SIM_CACHE[key] = (sim, cell_volume)
+    return sim, cell_volume
+
+
 def compute_heat_generation(
     current: float,
     duration_s: float = 1.0,
@@ -52,24 +97,10 @@ def compute_heat_generation(
             "pybamm is not installed. Install with `pip install pybamm` or disable electrochemical coupling."
         )
 
-    # Select model
-    if model_name.upper() == "SPM":
-        model = pybamm.lithium_ion.SPM(**model_kwargs)
-    elif model_name.upper() == "DFN":
-        model = pybamm.lithium_ion.DFN(**model_kwargs)
-    else:
-        raise ValueError(f"Unsupported model_name: {model_name}")
-
-    # Parameter values and simulation
-    param = model.default_parameter_values
-    # Override current function to constant value in Amps
-    C_rate = current / (param["Nominal cell capacity [A.h]"])
-    current_func = pybamm.Interpolant(np.array([0, duration_s]), np.array([C_rate, C_rate]))
-    param["Current function [A]" if "Current function [A]" in param else "Current function [A]"] = current_func
-
-    sim = pybamm.Simulation(model, parameter_values=param)
-    sim.build()
-    solution = sim.solve([0, duration_s])
+    sim, cell_volume = _cached_simulation(model_name, model_kwargs)
+    # Capacity is read from the simulation's own copy of the parameters
+    C_rate = current / (sim.parameter_values["Nominal cell capacity [A.h]"])
+    solution = sim.solve([0, duration_s], inputs={"Current function [A]": C_rate})
 
     # Total heating W.m-3 averaged over cell
     if "Total heating [W/m3]" in solution.keys():
@@ -77,8 +108,6 @@ def compute_heat_generation(
     else:
         heat_vol = solution["Total heating [W.m-3]"].data[-1]
 
-    # Cell volume parameter; fallback approximate cylindrical cell
-    cell_volume = param.get("Cell volume [m3]") or (param["Electrode width [m]"] * param["Electrode height [m]"] * param["Electrode thickness [m]"])
     heat_total = heat_vol * cell_volume  # Watts
 
     # Distribute evenly across zones (placeholder)
@@ -1,44 +1,279 @@
 """Visualization utilities for the thermal model."""
+import base64
+import io
+import logging
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 
+from . import _kernels
+from ._kernels import _njit, prange
 
-def plot_temperature_history(history: np.ndarray, save_path: Optional[str] = None):
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+try:
+    import datashader as ds  # type: ignore
+    import datashader.transfer_functions as tf  # type: ignore
+    import pandas as pd
+    import PIL  # type: ignore  # noqa: F401  (PNG encoding of the raster)
+except ImportError:  # pragma: no cover
+    ds = None  # pylint: disable=invalid-name
+
+_LAYOUT = {
+    "title": "Battery Temperature History",
+    "xaxis_title": "Time (s)",
+    "yaxis_title": "Temperature (°C)",
+    "template": "plotly_white",
+    # Constant revision keeps zoom/pan when a dashboard redraws the figure
+    "uirevision": "temperature",
+    # One shared hover label for all zones instead of one per trace
+    "hovermode": "x unified",
+}
+
+# Placeholders rendered into the cached HTML page, replaced by the figure JSON
+_DATA_PLACEHOLDER = [{"__data__": 0}]
+_LAYOUT_PLACEHOLDER = {"__layout__": 0}
+
+# Above this many zones all zones share one trace, without per-zone legend entries
+_MAX_LEGEND_ZONES = 8
+
+# With backend="auto", plots with more points (after M4) are rasterized by datashader
+_DATASHADER_MIN_SAMPLES = 1_000_000
+_RASTER_SIZE = (1200, 600)
+
+
+@_njit(parallel=True, fastmath=False)
+def _m4_kernel(history, starts, out):
+    """Fill ``out`` with M4 indices in one pass over ``history``.
+
+    Bins are processed in parallel; each walks its rows in memory order and
+    tracks the running extremes of every zone. NaN samples (line gaps) are
+    skipped, so fastmath stays off here.
+    """
+    steps, zones = history.shape
+    n_bins = starts.shape[0]
+    for b in prange(n_bins):
+        lo = starts[b]
+        hi = starts[b + 1] if b + 1 < n_bins else steps
+        i_min = np.full(zones, lo)
+        i_max = np.full(zones, lo)
+        v_min = history[lo].copy()
+        v_max = history[lo].copy()
+        for i in range(lo + 1, hi):
+            for z in range(zones):
+                v = history[i, z]
+                if np.isnan(v):
+                    continue
+                if v < v_min[z] or np.isnan(v_min[z]):
+                    v_min[z] = v
+                    i_min[z] = i
+                if v > v_max[z] or np.isnan(v_max[z]):
+                    v_max[z] = v
+                    i_max[z] = i
+        for z in range(zones):
+            out[4 * b, z] = lo
+            out[4 * b + 1, z] = min(i_min[z], i_max[z])
+            out[4 * b + 2, z] = max(i_min[z], i_max[z])
+            out[4 * b + 3, z] = hi - 1
+
+
+def _m4_downsample(history: np.ndarray, n_bins: int) -> np.ndarray:
+    """Return M4 sample indices of shape (4 * n_bins, num_zones).
+
+    The time axis is split into ``n_bins`` contiguous bins; per bin and zone
+    the first, last, minimum and maximum samples are kept, in time order, so
+    the drawn line matches the full data at one bin per pixel.
+    """
+    steps = history.shape[0]
+    starts = np.linspace(0, steps, n_bins + 1).astype(np.intp)[:-1]
+    if _kernels.NUMBA_AVAILABLE:
+        selected = np.empty((4 * n_bins, history.shape[1]), dtype=np.intp)
+        _m4_kernel(np.ascontiguousarray(history), starts, selected)
+        return selected
+    counts = np.diff(np.append(starts, steps))
+    index = np.arange(steps)[:, None]
+
+    def first_where(values: np.ndarray, extreme: np.ndarray) -> np.ndarray:
+        # Index of the first sample in each bin that equals the bin extreme;
+        # all-NaN bins have no match and fall back to the bin start
+        hit = values == np.repeat(extreme, counts, axis=0)
+        found = np.minimum.reduceat(np.where(hit, index, steps), starts, axis=0)
+        return np.where(found < steps, found, starts[:, None])
+
+    # fmin/fmax skip NaN line gaps, like the compiled kernel
+    argmin = first_where(history, np.fmin.reduceat(history, starts, axis=0))
+    argmax = first_where(history, np.fmax.reduceat(history, starts, axis=0))
+    first = np.broadcast_to(starts[:, None], argmin.shape)
+    last = first + (counts - 1)[:, None]
+    selected = np.sort(np.stack([first, argmin, argmax, last], axis=1), axis=1)
+    return selected.reshape(-1, history.shape[1])
+
+
+def _join_zones(x: np.ndarray, y: np.ndarray, steps: int):
+    """Flatten per-zone rows into one line, with a NaN gap between zones."""
+    # The NaN gaps need a float x axis; float32 holds the step index exactly up to 2**24
+    x_dtype = np.float32 if steps <= 1 << 24 else np.float64
+    gap = np.full((y.shape[0], 1), np.nan, dtype=np.float32)
+    return np.hstack([x.astype(x_dtype), gap]).ravel(), np.hstack([y, gap]).ravel()
+
+
+def _rasterize(x: np.ndarray, y: np.ndarray) -> dict:
+    """Render NaN-separated line data with datashader into a PNG image trace."""
+    width, height = _RASTER_SIZE
+    x_range = (float(np.nanmin(x)), float(np.nanmax(x)))
+    y_range = (float(np.nanmin(y)), float(np.nanmax(y)))
+    canvas = ds.Canvas(plot_width=width, plot_height=height, x_range=x_range, y_range=y_range)
+    agg = canvas.line(pd.DataFrame({"t": x, "T": y}), "t", "T", agg=ds.count())
+    image = tf.shade(agg, how="eq_hist")
+    # Keep row 0 at the lowest temperature, matching y0/dy on a non-reversed axis
+    png = io.BytesIO()
+    image.to_pil(origin="upper").save(png, format="PNG")
+    dx = (x_range[1] - x_range[0]) / width
+    dy = (y_range[1] - y_range[0]) / height
+    return {
+        "type": "image",
+        "source": "data:image/png;base64," + base64.b64encode(png.getvalue()).decode("ascii"),
+        "x0": x_range[0] + dx / 2,
+        "dx": dx,
+        "y0": y_range[0] + dy / 2,
+        "dy": dy,
+    }
+
+
+@lru_cache(maxsize=None)
+def _html_template() -> str:
+    """Standalone HTML page for a saved plot, with placeholder data and layout.
+
+    Rendered once: plotly otherwise rebuilds the page and re-hashes the
+    plotly.js bundle for the CDN integrity attribute on every write.
+    """
+    return pio.to_html(
+        {"data": _DATA_PLACEHOLDER, "layout": _LAYOUT_PLACEHOLDER},
+        config={"responsive": True},
+        include_plotlyjs="cdn",
+        full_html=True,
+        validate=False,
+        div_id="temperature-history",
+    )
+
+
+def _line_traces(
+    history: np.ndarray, time: np.ndarray, steps: int, stride: int, max_points_per_zone: int
+) -> list:
+    """Build the WebGL line traces for a (time, zones) float32 history."""
+    # Per-zone rows, transposed once so each trace gets a contiguous buffer
+    if history.shape[0] > max_points_per_zone:
+        selected = _m4_downsample(history, max_points_per_zone // 4)
+        x = np.ascontiguousarray(time[selected].T)
+        y = np.ascontiguousarray(np.take_along_axis(history, selected, axis=0).T)
+    else:
+        # All zones share the time axis; traces without x use x0 = 0 and dx = stride
+        x = None
+        y = np.ascontiguousarray(history.T)
+
+    # Plain dict traces skip the per-trace graph_objects constructors
+    if history.shape[1] > _MAX_LEGEND_ZONES:
+        # One trace for all zones; plotly.js breaks the line at each NaN
+        if x is None:
+            x = np.broadcast_to(time, y.shape)
+        x, y = _join_zones(x, y, steps)
+        traces = [{"type": "scattergl", "mode": "lines", "x": x, "y": y, "name": "zones", "hoverinfo": "y+name"}]
+    else:
+        names = [f"Zone {zone}" for zone in range(history.shape[1])]
+        traces = [
+            {
+                "type": "scattergl",
+                "mode": "lines",
+                "x": x[zone] if x is not None else (time if zone == 0 else None),
+                "dx": stride,
+                "y": y[zone],
+                "name": names[zone],
+                "hoverinfo": "y+name",
+            }
+            for zone in range(history.shape[1])
+        ]
+    return traces
+
+
+def plot_temperature_history(
+    history: np.ndarray,
+    save_path: Optional[str] = None,
+    max_points_per_zone: int = 4000,
+    stride: int = 1,
+    backend: str = "auto",
+):
     """Plot temperature profile over time.
 
     Parameters
     ----------
     history : np.ndarray
-        2-D array of shape (time_steps, num_zones).
+        2-D array of shape (time_steps, num_zones), or 1-D for a single zone.
     save_path : str | None
         If provided, save the figure to an HTML file; otherwise display it.
+    max_points_per_zone : int
+        Longer histories are reduced with M4 aggregation (first, last, min
+        and max per bin) to at most this many samples per zone.
+    stride : int
+        Plot only every ``stride``-th time step. This is lossy decimation
+        (peaks between kept steps are dropped), unlike the M4 reduction,
+        which is applied afterwards and preserves per-bin extremes.
+    backend : {"auto", "webgl", "datashader"}
+        ``"datashader"`` rasterizes all samples into a single image, so the
+        browser cost depends on the pixel count rather than the history
+        length. ``"auto"`` does so when more than one million points would
+        remain after M4 downsampling. Without datashader (and Pillow for the
+        PNG encoding) installed the WebGL traces are always used.
+
+    With more than eight zones all zones are drawn as a single trace.
     """
-    if history.ndim != 2:
-        raise ValueError("history must be 2-D array (time, zones)")
-
-    time = np.arange(history.shape[0])
-    fig = go.Figure()
-    for zone in range(history.shape[1]):
-        fig.add_trace(
-            go.Scatter(
-                x=time,
-                y=history[:, zone],
-                mode="lines",
-                name=f"Zone {zone}",
-            )
-        )
+    history = np.asarray(history)
+    if history.ndim == 1:
+        # Single zone; [:, None] is a view, not a copy
+        history = history[:, None]
+    elif history.ndim != 2:
+        raise ValueError("history must be 1-D (time) or 2-D array (time, zones)")
+    if max_points_per_zone < 4:
+        raise ValueError("max_points_per_zone must be at least 4 (one M4 bin)")
+    if stride < 1:
+        raise ValueError("stride must be a positive integer")
+    if backend not in ("auto", "webgl", "datashader"):
+        raise ValueError(f"Unknown backend: {backend}")
 
-    fig.update_layout(
-        title="Battery Temperature History",
-        xaxis_title="Time (s)",
-        yaxis_title="Temperature (°C)",
-        template="plotly_white",
-    )
+    steps = history.shape[0]
+    # WebGL draws in single precision anyway; float32 halves the payload. plotly
+    # ships float32/int32 arrays as base64 typed arrays (int64 would fall back
+    # to a JSON number list), so keep every plotted array in these dtypes.
+    history = np.ascontiguousarray(history[::stride], dtype=np.float32)
+    time = np.arange(0, steps, stride, dtype=np.int32)
+
+    if ds is not None and (
+        backend == "datashader"
+        or (
+            backend == "auto"
+            and min(history.shape[0], max_points_per_zone) * history.shape[1] > _DATASHADER_MIN_SAMPLES
+        )
+    ):
+        x, y = _join_zones(np.broadcast_to(time, history.T.shape), history.T, steps)
+        fig = go.Figure(data=[_rasterize(x, y)], layout=_LAYOUT)
+        # Image traces reverse the y axis unless autorange is set explicitly
+        fig.update_yaxes(autorange=True)
+    else:
+        fig = go.Figure(data=_line_traces(history, time, steps, stride, max_points_per_zone), layout=_LAYOUT)
 
     if save_path:
-        fig.write_html(save_path)
-        print(f"Saved temperature plot to {save_path}")
+        # Page loads plotly.js from the CDN instead of inlining ~3 MB per file
+        fig_json = fig.to_plotly_json()
+        html = (
+            _html_template()
+            .replace(pio.json.to_json_plotly(_DATA_PLACEHOLDER), pio.json.to_json_plotly(fig_json["data"]), 1)
+            .replace(pio.json.to_json_plotly(_LAYOUT_PLACEHOLDER), pio.json.to_json_plotly(fig_json["layout"]), 1)
+        )
+        with open(save_path, "w", encoding="utf-8") as handle:
+            handle.write(html)
+        logger.info("Saved temperature plot to %s", save_path)
     else:
-        fig.show() 
\ No newline at end of file
+        fig.show()